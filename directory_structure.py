@@ -1,11 +1,31 @@
 import os
+import argparse
+import asyncio
 import fnmatch
+import json
 import sys
-import tkinter as tk
-from tkinter import filedialog, scrolledtext, messagebox, ttk
-from tkinter.font import Font
-
-sys.stdout.reconfigure(encoding="utf-8")
+import tarfile
+import threading
+import urllib.parse
+import urllib.request
+import zipfile
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+try:
+    import tkinter as tk
+    from tkinter import filedialog, scrolledtext, messagebox, ttk
+    from tkinter.font import Font
+except ImportError:
+    tk = None  # Only the GUI needs Tk; the CLI, daemon and library functions do not
+
+ZIP_EXTENSIONS = (".zip", ".jar", ".whl")
+TAR_EXTENSIONS = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+MAX_ARCHIVE_SIZE = 100 * 1024 * 1024  # Bytes; larger archives are listed as plain files
+MAX_ARCHIVE_ENTRIES = 10000
+DEFAULT_REMOVE_OBJECTS = ["venv", ".git", "__pycache__", "node_modules"]
+DEFAULT_SERVER_PORT = 8765
+DEFAULT_CACHE_SIZE = 64 * 1024 * 1024  # Bytes of cached tree text
+CLIENT_HEADER = "X-File-Lister"  # Required on daemon requests so browsers cannot send them
 
 
 def load_gitignore(gitignore_path):
@@ -32,15 +52,115 @@ def should_ignore(path, ignore_patterns, is_dir=False):
     return False
 
 
-def list_files(startpath, remove_objects=None, max_levels=None, gitignore=True, output_file=None):
-    """Recursively list files and directories in a tree format."""
+def read_archive_index(path, max_size=MAX_ARCHIVE_SIZE, max_entries=MAX_ARCHIVE_ENTRIES):
+    """Read the member index of a zip or tar archive without extracting anything.
+
+    Returns (tree, truncated), where tree is a nested {"dirs": {}, "files": {}}
+    dict (files maps names to None, keeping member order), or None if the
+    file is not a readable archive or exceeds max_size.
+    """
+    name = path.lower()
+    if not name.endswith(ZIP_EXTENSIONS + TAR_EXTENSIONS):
+        return None
+    try:
+        if os.path.getsize(path) > max_size:
+            return None
+        members = []
+        truncated = False
+        if name.endswith(ZIP_EXTENSIONS):
+            # Only the central directory is read
+            with zipfile.ZipFile(path) as archive:
+                for info in archive.infolist():
+                    if len(members) >= max_entries:
+                        truncated = True
+                        break
+                    members.append((info.filename, info.is_dir()))
+        else:
+            # A plain tar can seek past member data; compressed ones are streamed
+            # header by header since they have to be decompressed in order anyway
+            mode = "r:" if name.endswith(".tar") else "r|*"
+            with tarfile.open(path, mode=mode) as archive:
+                for info in archive:
+                    if len(members) >= max_entries:
+                        truncated = True
+                        break
+                    members.append((info.name, info.isdir()))
+    except (OSError, EOFError, ValueError, zipfile.BadZipFile, tarfile.TarError):
+        # ValueError covers member names that fail to decode
+        return None
+
+    tree = {"dirs": {}, "files": {}}
+    for member, is_dir in members:
+        parts = [part for part in member.split("/") if part and part != "."]
+        if not parts:
+            continue
+        node = tree
+        for part in parts[:-1] if not is_dir else parts:
+            node = node["dirs"].setdefault(part, {"dirs": {}, "files": {}})
+        if not is_dir:
+            node["files"][parts[-1]] = None
+    return tree, truncated
+
+
+def archive_lines(index, archive_path, level, remove_objects=None, ignore_patterns=None,
+                  max_levels=None):
+    """Render an archive index as tree lines, as if the archive were a directory at level."""
     remove_objects = remove_objects or []
-    ignore_patterns = load_gitignore(os.path.join(
-        startpath, ".gitignore")) if gitignore else []
-    output_lines = ["./"]
+    ignore_patterns = ignore_patterns or []
+    tree, truncated = index
+    lines = []
+
+    def add_node(node, path, level):
+        if max_levels is not None and level > max_levels:
+            return
+        dirs = [d for d in node["dirs"] if d not in remove_objects and not should_ignore(
+            os.path.join(path, d), ignore_patterns, is_dir=True)]
+        files = node["files"]
+        subindent = "│   " * level + "├── "
+        if not files and not dirs and not truncated:
+            lines.append(f"{subindent}(empty)")  # Members may lie past the cap
+        for i, f in enumerate(files):
+            if not should_ignore(os.path.join(path, f), ignore_patterns, is_dir=False):
+                file_indent = "└── " if i == len(files) - 1 else "├── "
+                lines.append(f"{subindent}{file_indent}{f}")
+        for d in dirs:
+            if max_levels is None or level + 1 <= max_levels:
+                lines.append(f"{subindent}{d}/")
+            add_node(node["dirs"][d], os.path.join(path, d), level + 1)
+
+    add_node(tree, archive_path, level)
+    if truncated and (max_levels is None or level <= max_levels):
+        lines.append("│   " * level + "├── (truncated)")
+    return lines
 
-    def write_output(text):
-        output_lines.append(text)
+
+def _mtime(path):
+    """Return the mtime of a path in nanoseconds, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def iter_files(startpath, remove_objects=None, max_levels=None, gitignore=True,
+               archives=False, max_archive_size=MAX_ARCHIVE_SIZE,
+               max_archive_entries=MAX_ARCHIVE_ENTRIES, mtimes=None):
+    """Yield the lines of the tree built by list_files one at a time.
+
+    If mtimes is a dict, it is filled with the mtime of every directory
+    visited and every file whose contents the listing depends on (.gitignore
+    and archives), so a cached listing can be checked for staleness. Each
+    mtime is taken before the path is read, so a change made while the walk
+    runs always makes the snapshot stale rather than going unnoticed.
+    """
+    remove_objects = remove_objects or []
+    gitignore_path = os.path.join(startpath, ".gitignore")
+    if mtimes is not None:
+        mtimes[startpath] = _mtime(startpath)
+        if gitignore:
+            mtimes[gitignore_path] = _mtime(gitignore_path)
+    ignore_patterns = load_gitignore(gitignore_path) if gitignore else []
+    yield "./"
 
     for root, dirs, files in os.walk(startpath):
         level = root.replace(startpath, "").count(os.sep)
@@ -49,28 +169,383 @@ def list_files(startpath, remove_objects=None, max_levels=None, gitignore=True,
             continue
         dirs[:] = [d for d in dirs if d not in remove_objects and not should_ignore(
             os.path.join(root, d), ignore_patterns, is_dir=True)]
+        if mtimes is not None and (max_levels is None or level + 1 <= max_levels):
+            # os.walk scans these only after this step, so the stat comes first
+            for d in dirs:
+                mtimes[os.path.join(root, d)] = _mtime(os.path.join(root, d))
         indent = "│   " * (level - 1) + "├── " if level > 0 else ""
         subindent = "│   " * level + "├── "
         if root != startpath:
-            write_output(f"{indent}{os.path.basename(root)}/")
+            yield f"{indent}{os.path.basename(root)}/"
         if not files and not dirs:
-            write_output(f"{subindent}(empty)")
+            yield f"{subindent}(empty)"
         for i, f in enumerate(files):
             if not should_ignore(os.path.join(root, f), ignore_patterns, is_dir=False):
                 file_indent = "└── " if i == len(files) - 1 else "├── "
-                write_output(f"{subindent}{file_indent}{f}")
-    result_text = "\n".join(output_lines)
+                yield f"{subindent}{file_indent}{f}"
+                if archives and (max_levels is None or level + 1 <= max_levels):
+                    archive_path = os.path.join(root, f)
+                    if mtimes is not None and f.lower().endswith(ZIP_EXTENSIONS + TAR_EXTENSIONS):
+                        # Recorded even if unreadable now, e.g. while still being copied
+                        mtimes[archive_path] = _mtime(archive_path)
+                    index = read_archive_index(
+                        archive_path, max_archive_size, max_archive_entries)
+                    if index:
+                        yield from archive_lines(
+                            index, archive_path, level + 1, remove_objects,
+                            ignore_patterns, max_levels)
+
+
+def list_files(startpath, remove_objects=None, max_levels=None, gitignore=True, output_file=None,
+               archives=False, max_archive_size=MAX_ARCHIVE_SIZE,
+               max_archive_entries=MAX_ARCHIVE_ENTRIES):
+    """Recursively list files and directories in a tree format.
+
+    With archives=True, zip and tar archives are expanded as virtual subtrees
+    from their index, skipping those over max_archive_size bytes and listing
+    at most max_archive_entries members of each.
+    """
+    result_text = "\n".join(iter_files(
+        startpath, remove_objects, max_levels, gitignore,
+        archives, max_archive_size, max_archive_entries))
     if output_file:
         with open(output_file, "w", encoding="utf-8") as file:
             file.write(result_text)
     return result_text
 
 
+def _scan_directory(path):
+    """Split the entries of a directory into subdirectories and files, as os.walk does."""
+    dirs, files, symlinks = [], [], set()
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                dirs.append(entry.name)
+                if entry.is_symlink():
+                    symlinks.add(entry.name)  # Listed, but not followed
+            else:
+                files.append(entry.name)
+    return dirs, files, symlinks
+
+
+async def alist_files(startpath, remove_objects=None, max_levels=None, gitignore=True,
+                      max_concurrency=8, executor=None, archives=False,
+                      max_archive_size=MAX_ARCHIVE_SIZE, max_archive_entries=MAX_ARCHIVE_ENTRIES):
+    """Asynchronously yield the lines of the tree that list_files would build.
+
+    Directory scans run in an executor with at most max_concurrency of them in
+    flight; up to max_concurrency sibling directories are scanned ahead while
+    earlier lines are consumed.
+    Closing the iterator or cancelling its task cancels the scans still pending.
+    Archives are expanded as in list_files, reading their index in the executor.
+    """
+    remove_objects = remove_objects or []
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(max_concurrency)
+    pending = set()
+
+    async def scan(path):
+        async with semaphore:
+            return await loop.run_in_executor(executor, _scan_directory, path)
+
+    async def read_archive(path):
+        async with semaphore:
+            return await loop.run_in_executor(
+                executor, read_archive_index, path, max_archive_size, max_archive_entries)
+
+    def schedule(path):
+        task = loop.create_task(scan(path))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+        return task
+
+    async def walk(root, level, scan_task):
+        try:
+            dirs, files, symlinks = await scan_task
+        except OSError:
+            return  # os.walk skips directories it cannot read
+        dirs = [d for d in dirs if d not in remove_objects and not should_ignore(
+            os.path.join(root, d), ignore_patterns, is_dir=True)]
+        descend = max_levels is None or level + 1 <= max_levels
+        subdirs = [d for d in dirs if descend and d not in symlinks]
+        # Prefetch only a window of siblings so a slow consumer bounds memory
+        tasks = [schedule(os.path.join(root, d)) for d in subdirs[:max_concurrency]]
+        indent = "│   " * (level - 1) + "├── " if level > 0 else ""
+        subindent = "│   " * level + "├── "
+        if level > 0:
+            yield f"{indent}{os.path.basename(root)}/"
+        if not files and not dirs:
+            yield f"{subindent}(empty)"
+        for i, f in enumerate(files):
+            if not should_ignore(os.path.join(root, f), ignore_patterns, is_dir=False):
+                file_indent = "└── " if i == len(files) - 1 else "├── "
+                yield f"{subindent}{file_indent}{f}"
+                if archives and descend and f.lower().endswith(ZIP_EXTENSIONS + TAR_EXTENSIONS):
+                    index = await read_archive(os.path.join(root, f))
+                    if index:
+                        for line in archive_lines(index, os.path.join(root, f), level + 1,
+                                                  remove_objects, ignore_patterns, max_levels):
+                            yield line
+        for i, d in enumerate(subdirs):
+            if i + max_concurrency < len(subdirs):
+                tasks.append(schedule(os.path.join(root, subdirs[i + max_concurrency])))
+            async for line in walk(os.path.join(root, d), level + 1, tasks[i]):
+                yield line
+
+    ignore_patterns = await loop.run_in_executor(
+        executor, load_gitignore, os.path.join(startpath, ".gitignore")) if gitignore else []
+    yield "./"
+    if max_levels is not None and max_levels < 0:
+        return
+    try:
+        async for line in walk(startpath, 0, schedule(startpath)):
+            yield line
+    finally:
+        tasks = list(pending)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class ListingCache:
+    """LRU cache of tree listings, evicting by total size in bytes.
+
+    Each entry remembers the mtimes its walk observed and is dropped on
+    lookup if any of them changed.
+    """
+
+    def __init__(self, max_size=DEFAULT_CACHE_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        text, mtimes, size = entry
+        # Stat outside the lock so a large snapshot does not block other clients
+        if any(_mtime(path) != mtime for path, mtime in mtimes.items()):
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+                    self.size -= size
+            return None
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return text
+
+    def put(self, key, text, mtimes):
+        # Count the snapshot too: roughly a path string plus dict and int overhead per entry
+        size = len(text.encode("utf-8")) + sum(len(path) + 150 for path in mtimes)
+        if size > self.max_size:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old[2]
+            self._entries[key] = (text, mtimes, size)
+            self.size += size
+            while self.size > self.max_size:
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self.size -= evicted
+
+
+class _SharedWalk:
+    """A walk running in its own thread whose lines any number of clients can follow."""
+
+    def __init__(self):
+        self.lines = []
+        self.done = False
+        self.error = None
+        self._condition = threading.Condition()
+
+    def run(self, lines, on_done):
+        try:
+            for line in lines:
+                with self._condition:
+                    self.lines.append(line)
+                    self._condition.notify_all()
+        except Exception as e:
+            self.error = e
+        finally:
+            on_done(self)
+            with self._condition:
+                self.done = True
+                self._condition.notify_all()
+
+    def follow(self):
+        position = 0
+        while True:
+            with self._condition:
+                while position >= len(self.lines) and not self.done:
+                    self._condition.wait()
+                new_lines = self.lines[position:]
+                position = len(self.lines)
+                done = self.done
+            yield from new_lines
+            if done:
+                if self.error is not None:
+                    raise self.error
+                return
+
+
+class ListingService:
+    """Serve list_files results from a shared cache, merging identical concurrent walks."""
+
+    def __init__(self, cache_size=DEFAULT_CACHE_SIZE):
+        self.cache = ListingCache(cache_size)
+        self._walks = {}
+        self._lock = threading.Lock()
+
+    def lines(self, startpath, remove_objects=None, max_levels=None, gitignore=True,
+              archives=False, max_archive_size=MAX_ARCHIVE_SIZE,
+              max_archive_entries=MAX_ARCHIVE_ENTRIES):
+        """Yield the tree lines for startpath as soon as they are available."""
+        startpath = os.path.abspath(startpath)
+        options = (tuple(remove_objects or []), max_levels, gitignore,
+                   archives, max_archive_size, max_archive_entries)
+        key = (startpath,) + options
+        text = self.cache.get(key)
+        if text is not None:
+            yield from text.split("\n")
+            return
+
+        with self._lock:
+            walk = self._walks.get(key)
+            if walk is None:
+                walk = self._walks[key] = _SharedWalk()
+                mtimes = {}
+
+                def finish(walk):
+                    if walk.error is None:
+                        self.cache.put(key, "\n".join(walk.lines), mtimes)
+                    with self._lock:
+                        del self._walks[key]
+
+                # The walk outlives the client that started it, so others can keep following
+                threading.Thread(
+                    target=walk.run,
+                    args=(iter_files(startpath, *options, mtimes=mtimes), finish),
+                    daemon=True).start()
+        yield from walk.follow()
+
+    def list_files(self, startpath, **options):
+        return "\n".join(self.lines(startpath, **options))
+
+
+class ListingRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for a ListingService.
+
+    GET /list returns the whole tree as text; GET /stream sends it as
+    newline-delimited JSON objects while the walk is still running. Both take
+    path, max_levels, gitignore, archives and repeated remove parameters.
+
+    Requests must name the daemon as 127.0.0.1 or localhost in the Host
+    header, which defeats DNS rebinding, and carry CLIENT_HEADER, which a
+    cross-site page cannot add without a preflight the daemon never answers.
+    """
+
+    def do_GET(self):
+        port = self.server.server_port
+        if self.headers.get("Host") not in (f"127.0.0.1:{port}", f"localhost:{port}") \
+                or CLIENT_HEADER not in self.headers:
+            self.send_error(403, "Forbidden")
+            return
+        url = urllib.parse.urlsplit(self.path)
+        if url.path not in ("/list", "/stream"):
+            self.send_error(404, "Unknown endpoint")
+            return
+        query = urllib.parse.parse_qs(url.query)
+        try:
+            startpath = query["path"][0]
+            max_levels = int(query["max_levels"][0]) if "max_levels" in query else None
+        except (KeyError, ValueError):
+            self.send_error(400, "Expected a path and an integer max_levels")
+            return
+        if not os.path.isdir(startpath):
+            self.send_error(404, "Directory not found")
+            return
+        lines = self.server.service.lines(
+            startpath,
+            remove_objects=query.get("remove", []),
+            max_levels=max_levels,
+            gitignore=query.get("gitignore", ["1"])[0] != "0",
+            archives=query.get("archives", ["0"])[0] != "0")
+
+        if url.path == "/list":
+            try:
+                body = "\n".join(lines).encode("utf-8")
+            except Exception as e:
+                self.send_error(500, str(e))
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        try:
+            for line in lines:
+                self.wfile.write(json.dumps({"line": line}).encode("utf-8") + b"\n")
+            self.wfile.write(b'{"done": true}\n')
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client went away; the shared walk carries on for the others
+        except Exception as e:
+            self.wfile.write(json.dumps({"error": str(e)}).encode("utf-8") + b"\n")
+        self.close_connection = True
+
+
+def serve(port=DEFAULT_SERVER_PORT, cache_size=DEFAULT_CACHE_SIZE):
+    """Run the listing daemon on localhost until interrupted.
+
+    It only binds the loopback address, since it lists any path it is asked for.
+    """
+    host = "127.0.0.1"
+    server = ThreadingHTTPServer((host, port), ListingRequestHandler)
+    server.daemon_threads = True
+    server.service = ListingService(cache_size)
+    print(f"Serving directory listings on http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def fetch_listing(server_url, startpath, remove_objects=None, max_levels=None, gitignore=True,
+                  archives=False, timeout=None):
+    """Fetch the tree for startpath from a running listing daemon."""
+    query = [("path", os.path.abspath(startpath)),
+             ("gitignore", "1" if gitignore else "0"),
+             ("archives", "1" if archives else "0")]
+    query += [("remove", name) for name in remove_objects or []]
+    if max_levels is not None:
+        query.append(("max_levels", str(max_levels)))
+    url = f"{server_url.rstrip('/')}/list?{urllib.parse.urlencode(query)}"
+    request = urllib.request.Request(url, headers={CLIENT_HEADER: "1"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read().decode("utf-8")
+
+
 class FileListerApp:
     """Tkinter GUI for file listing script with enhanced styling."""
 
-    def __init__(self, root):
+    def __init__(self, root, server_url=None):
         self.root = root
+        self.server_url = server_url  # Listing daemon to query instead of walking locally
         self.root.title("File Lister Pro")
         self.root.geometry("900x700")
 
@@ -225,6 +700,13 @@ class FileListerApp:
             variable=self.gitignore_var)
         self.gitignore_check.grid(row=0, column=0, padx=(0, 15))
 
+        self.archives_var = tk.BooleanVar(value=False)
+        self.archives_check = ttk.Checkbutton(
+            options_frame,
+            text="List inside zip/tar archives",
+            variable=self.archives_var)
+        self.archives_check.grid(row=0, column=1, padx=(0, 15))
+
         # Output file selection
         ttk.Label(border_frame,
                   text="Save To File:",
@@ -324,6 +806,7 @@ class FileListerApp:
         startpath = self.dir_entry.get()
         max_levels_str = self.max_level_var.get()
         gitignore = self.gitignore_var.get()
+        archives = self.archives_var.get()
         output_file = self.output_file_entry.get() or None
 
         if not startpath:
@@ -344,13 +827,27 @@ class FileListerApp:
                         "Invalid depth value - using unlimited depth")
 
             # Call the list_files function with appropriate parameters
-            result = list_files(
-                startpath,
-                remove_objects=["venv", ".git", "__pycache__", "node_modules"],
-                max_levels=max_levels,
-                gitignore=gitignore,
-                output_file=output_file
-            )
+            if self.server_url:
+                result = fetch_listing(
+                    self.server_url,
+                    startpath,
+                    remove_objects=DEFAULT_REMOVE_OBJECTS,
+                    max_levels=max_levels,
+                    gitignore=gitignore,
+                    archives=archives
+                )
+                if output_file:
+                    with open(output_file, "w", encoding="utf-8") as file:
+                        file.write(result)
+            else:
+                result = list_files(
+                    startpath,
+                    remove_objects=DEFAULT_REMOVE_OBJECTS,
+                    max_levels=max_levels,
+                    gitignore=gitignore,
+                    output_file=output_file,
+                    archives=archives
+                )
 
             # Update the text area with the result
             self.output_text.delete(1.0, tk.END)
@@ -703,6 +1200,38 @@ SOFTWARE."""
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Display directory structures as a tree.")
+    parser.add_argument("path", nargs="?",
+                        help="print the tree of this directory instead of opening the GUI")
+    parser.add_argument("--max-levels", type=int, help="maximum depth to list")
+    parser.add_argument("--no-gitignore", action="store_true",
+                        help="do not apply .gitignore patterns")
+    parser.add_argument("--archives", action="store_true",
+                        help="list inside zip and tar archives")
+    parser.add_argument("--server", metavar="URL",
+                        help="get listings from a running daemon, e.g. http://127.0.0.1:8765")
+    parser.add_argument("--serve", action="store_true", help="run the listing daemon")
+    parser.add_argument("--port", type=int, default=DEFAULT_SERVER_PORT,
+                        help="port for --serve to listen on")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+                        help="daemon cache size in MB")
+    args = parser.parse_args()
+    sys.stdout.reconfigure(encoding="utf-8")
+
+    if args.serve:
+        serve(args.port, args.cache_size * 1024 * 1024)
+        sys.exit()
+    if args.path:
+        options = dict(remove_objects=DEFAULT_REMOVE_OBJECTS, max_levels=args.max_levels,
+                       gitignore=not args.no_gitignore, archives=args.archives)
+        if args.server:
+            print(fetch_listing(args.server, args.path, **options))
+        else:
+            print(list_files(args.path, **options))
+        sys.exit()
+    if tk is None:
+        parser.error("the GUI needs Tkinter; pass a path to print the tree instead")
+
     root = tk.Tk()
 
     # Set application icon - using fox.ico from root folder
@@ -716,5 +1245,5 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Error setting icon: {e}")
 
-    app = FileListerApp(root)
+    app = FileListerApp(root, server_url=args.server)
     root.mainloop()